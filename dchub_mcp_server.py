@@ -10,17 +10,37 @@ Runs on port 8888 internally, proxied through Flask on port 5000 at /mcp
 """
 
 import os
+import asyncio
+import atexit
+import hashlib
 import json
 import logging
+import queue
+import re
 import sqlite3
-from datetime import datetime, timezone
+import threading
+import time
 from contextvars import ContextVar
+from urllib.parse import urlencode
 
-import requests as http_requests
+import httpx
+import orjson
+from cachetools import TTLCache
 from mcp.server.fastmcp import FastMCP
 
+# APSW has a connection-level prepared-statement cache and a thinner
+# Python/C bridge than stdlib sqlite3; use it when available.
+try:
+    import apsw
+    _HAVE_APSW = True
+except ImportError:
+    apsw = None
+    _HAVE_APSW = False
+
 # Context variable to store API key from incoming requests
 _current_api_key: ContextVar[str] = ContextVar("current_api_key", default="")
+# Bound method, looked up once — skips the attribute lookup on every call.
+_get_api_key = _current_api_key.get
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -36,6 +56,143 @@ DB_PATH = os.environ.get("DB_PATH", "dchub_data.db")
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("dchub_mcp")
 
+# ---------------------------------------------------------------------------
+# Analytics DB — persistent connection, batched writes
+# ---------------------------------------------------------------------------
+
+# One connection for the life of the process. Opening/committing/closing per
+# insert turns every tool call into its own transaction (one fsync each);
+# batching amortizes that cost across many rows. _db is whatever object
+# carries .execute for setup statements (the apsw cursor or the sqlite3
+# connection itself).
+if _HAVE_APSW:
+    _conn = apsw.Connection(DB_PATH)
+    _db = _conn.cursor()
+else:
+    _conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+    _db = _conn
+_db.execute("PRAGMA journal_mode=WAL")
+_db.execute("PRAGMA synchronous=NORMAL")
+_db.execute("PRAGMA temp_store=MEMORY")
+_db.execute("PRAGMA mmap_size=268435456")  # 256 MB
+_db.execute("PRAGMA cache_size=-65536")    # 64 MB page cache
+# Timestamps are stored as raw time.time_ns() integers — much cheaper to
+# produce than an ISO string and still sortable. The mcp_requests_v view
+# formats them for human readers.
+#
+# Params are stored in plain columns p1..p6 (one per parameter slot, mapped
+# by _TOOL_PARAM_SLOTS below) rather than a JSON blob, so analytics queries
+# can scan and GROUP BY a column directly instead of calling json_extract.
+_db.execute("""
+    CREATE TABLE IF NOT EXISTS mcp_requests (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        ts_ns INTEGER,
+        tool TEXT,
+        p1 TEXT, p2 TEXT, p3 TEXT, p4 TEXT, p5 TEXT, p6 TEXT,
+        source TEXT
+    )
+""")
+# Databases created with earlier schemas need the newer columns added.
+_columns = {row[1] for row in _db.execute("PRAGMA table_info(mcp_requests)")}
+for _col, _type in (
+    ("ts_ns", "INTEGER"),
+    ("p1", "TEXT"), ("p2", "TEXT"), ("p3", "TEXT"),
+    ("p4", "TEXT"), ("p5", "TEXT"), ("p6", "TEXT"),
+):
+    if _col not in _columns:
+        _db.execute(f"ALTER TABLE mcp_requests ADD COLUMN {_col} {_type}")
+_db.execute(
+    "CREATE INDEX IF NOT EXISTS idx_mcp_requests_tool_ts_ns ON mcp_requests(tool, ts_ns)"
+)
+_db.execute("DROP VIEW IF EXISTS mcp_requests_v")
+_db.execute("""
+    CREATE VIEW mcp_requests_v AS
+    SELECT datetime(ts_ns / 1000000000, 'unixepoch') AS timestamp,
+           tool, p1, p2, p3, p4, p5, p6, source
+    FROM mcp_requests
+""")
+
+# Which parameter lands in which pN column, per tool. Keep in sync with the
+# params each tool builds.
+_TOOL_PARAM_SLOTS = {
+    "search_facilities": ("query", "country", "state", "city", "provider", "limit"),
+    "get_facility": ("facility_id",),
+    "list_transactions": ("year", "buyer", "seller", "limit"),
+    "get_market_intel": ("market", "metric"),
+    "get_news": ("topic", "source", "limit"),
+    "analyze_site": ("lat", "lng", "address", "radius"),
+}
+
+# Tool coroutines only do an O(1) put_nowait; a daemon thread owns the
+# connection and does the batched commits, so the event loop never waits
+# on disk I/O.
+_track_q: queue.Queue = queue.Queue(maxsize=10000)
+_BATCH_MAX = 64
+
+
+_INSERT_SQL = (
+    "INSERT INTO mcp_requests (ts_ns, tool, p1, p2, p3, p4, p5, p6, source)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _write_batch(batch: list):
+    """Write a batch of tracking rows in a single transaction."""
+    try:
+        if _HAVE_APSW:
+            # Fresh cursors are cheap; the prepared INSERT is reused via
+            # the connection's statement cache.
+            with _conn:
+                _conn.cursor().executemany(_INSERT_SQL, batch)
+        else:
+            _conn.execute("BEGIN")
+            try:
+                _conn.executemany(_INSERT_SQL, batch)
+                _conn.execute("COMMIT")
+            except Exception:
+                # Leave no transaction open — a dangling BEGIN makes every
+                # later flush fail with "cannot start a transaction within
+                # a transaction". (The APSW branch rolls back via its
+                # context manager.)
+                try:
+                    _conn.execute("ROLLBACK")
+                except sqlite3.Error:
+                    pass
+                raise
+    except Exception as exc:
+        logger.warning("Failed to flush %d tracked MCP requests: %s", len(batch), exc)
+
+
+def _writer_loop():
+    """Drain the tracking queue and commit rows in batches."""
+    while True:
+        try:
+            batch = [_track_q.get(timeout=0.5)]
+        except queue.Empty:
+            continue
+        while len(batch) < _BATCH_MAX:
+            try:
+                batch.append(_track_q.get_nowait())
+            except queue.Empty:
+                break
+        _write_batch(batch)
+
+
+def _flush_remaining():
+    """Write whatever is still queued at shutdown."""
+    batch = []
+    while True:
+        try:
+            batch.append(_track_q.get_nowait())
+        except queue.Empty:
+            break
+    if batch:
+        _write_batch(batch)
+
+
+threading.Thread(target=_writer_loop, daemon=True).start()
+atexit.register(_flush_remaining)
+
 # ---------------------------------------------------------------------------
 # FastMCP Server — Stateless HTTP with JSON responses
 # ---------------------------------------------------------------------------
@@ -50,62 +207,154 @@ mcp = FastMCP(
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _api_get(path: str, params: dict = None) -> dict:
+# Shared async client with a keep-alive pool: tool handlers are async, so
+# backend calls must not block the event loop, and pooled connections skip
+# the per-request TCP handshake. base_url is resolved once here, so no URL
+# string is rebuilt per request — tools pass bare paths.
+_BASE = BACKEND_BASE.rstrip("/")
+
+# http2 and limits must live on the explicit transport — httpx ignores the
+# client-level kwargs once a transport is passed.
+_client = httpx.AsyncClient(
+    base_url=_BASE,
+    timeout=httpx.Timeout(15.0, connect=2.0),
+    transport=httpx.AsyncHTTPTransport(
+        retries=2,
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    ),
+)
+
+
+# Short-lived response cache: every tool is readOnly/idempotent, so repeated
+# queries within the TTL can skip the backend entirely. The API key is part
+# of the cache key so authenticated results never leak across tenants.
+_cache: TTLCache = TTLCache(maxsize=2048, ttl=60)
+_cache_lock = threading.Lock()
+
+# Single-flight: concurrent identical requests share one backend fetch.
+# Only touched from the event loop thread, so no lock is needed.
+_inflight: dict = {}
+
+
+def _encode(obj) -> str:
+    """Serialize a tool result compactly — MCP clients are machines, not humans."""
+    return orjson.dumps(obj).decode()
+
+
+def _params(**kw) -> dict:
+    """Build a query-param dict from keyword args, dropping falsy values."""
+    out = {}
+    for k, v in kw.items():
+        if v:
+            out[k] = v
+    return out
+
+
+def _clamp(v, lo, hi):
+    """Clamp a numeric input to [lo, hi] so oversized values never reach the backend."""
+    return lo if v < lo else hi if v > hi else v
+
+
+def _cache_key(path: str, params: dict, api_key: str) -> bytes:
+    raw = path + urlencode(sorted((params or {}).items())) + api_key
+    return hashlib.blake2b(raw.encode(), digest_size=16).digest()
+
+
+async def _api_get(path: str, params: dict = None) -> dict:
     """Call the Flask backend API and return JSON, forwarding API key if present."""
-    url = f"{BACKEND_BASE}{path}"
-    
     # Build headers, forwarding API key if available
     headers = {}
-    api_key = _current_api_key.get()
+    api_key = _get_api_key()
     if api_key:
         headers["X-API-Key"] = api_key
-        logger.debug(f"Forwarding API key to backend: {api_key[:16]}...")
-    
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Forwarding API key to backend: %s...", api_key[:16])
+
+    key = _cache_key(path, params, api_key)
+    with _cache_lock:
+        cached = _cache.get(key)
+    if cached is not None:
+        return cached
+
+    # If the same request is already in flight, wait for its result instead
+    # of issuing a duplicate backend call.
+    fut = _inflight.get(key)
+    if fut is not None:
+        return await fut
+
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[key] = fut
     try:
-        resp = http_requests.get(url, params=params or {}, headers=headers, timeout=15)
-        resp.raise_for_status()
-        return resp.json()
-    except http_requests.RequestException as exc:
-        logger.error("API call failed: %s %s — %s", path, params, exc)
-        return {"error": f"Backend request failed: {str(exc)}"}
+        try:
+            resp = await _client.get(path, params=params or None, headers=headers)
+            resp.raise_for_status()
+            result = resp.json()
+        except (httpx.HTTPError, json.JSONDecodeError) as exc:
+            # JSONDecodeError covers non-JSON backend bodies (e.g. an HTML
+            # error page from the proxy), which httpx.HTTPError does not.
+            logger.error("API call failed: %s %s — %s", path, params, exc)
+            result = {"error": f"Backend request failed: {str(exc)}"}
+        else:
+            # Don't cache failures — let the next call retry the backend.
+            if not (isinstance(result, dict) and "error" in result):
+                with _cache_lock:
+                    _cache[key] = result
+        fut.set_result(result)
+        return result
+    except BaseException as exc:
+        # Anything escaping the fetch — including cancellation of this
+        # task — must still resolve the future, or coalesced waiters would
+        # see a spurious CancelledError inside their own requests. Hand
+        # them the usual error dict and re-raise for this caller.
+        fut.set_result({"error": f"Backend request failed: {exc!r}"})
+        raise
+    finally:
+        _inflight.pop(key, None)
 
 
 def _track_mcp_request(tool_name: str, params: dict, source: str = "mcp"):
-    """Log MCP tool invocations to SQLite for analytics."""
+    """Queue an MCP tool invocation for the background analytics writer."""
+    slots = _TOOL_PARAM_SLOTS.get(tool_name, ())
+    values = [None, None, None, None, None, None]
+    for i, k in enumerate(slots):
+        v = params.get(k)
+        if v is not None:
+            values[i] = str(v)
+    row = (time.time_ns(), tool_name, *values, source)
     try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS mcp_requests (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT,
-                tool TEXT,
-                params TEXT,
-                source TEXT
-            )
-        """)
-        conn.execute(
-            "INSERT INTO mcp_requests (timestamp, tool, params, source) VALUES (?, ?, ?, ?)",
-            (datetime.now(timezone.utc).isoformat(), tool_name, json.dumps(params), source),
-        )
-        conn.commit()
-        conn.close()
-    except Exception as exc:
-        logger.warning("Failed to track MCP request: %s", exc)
+        _track_q.put_nowait(row)
+    except queue.Full:
+        logger.warning("Tracking queue full, dropping %s event", tool_name)
 
 
 # ---------------------------------------------------------------------------
 # MCP Tools
 # ---------------------------------------------------------------------------
 
+# Every query tool shares the same read-only annotation set; only the title
+# differs per tool.
+_READONLY_ANN = {
+    "readOnlyHint": True,
+    "destructiveHint": False,
+    "idempotentHint": True,
+    "openWorldHint": True,
+}
+
+
+async def _run_tool(name: str, path: str, params: dict = None, track: dict = None) -> str:
+    """Shared tail of every query tool: track the call, fetch, encode.
+
+    The tools keep their explicit typed signatures (FastMCP derives the
+    tool schemas from them); only the identical body lives here.
+    """
+    _track_mcp_request(name, track if track is not None else (params or {}))
+    return _encode(await _api_get(path, params))
+
+
 @mcp.tool(
     name="search_facilities",
-    annotations={
-        "title": "Search Data Center Facilities",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
+    annotations={**_READONLY_ANN, "title": "Search Data Center Facilities"},
 )
 async def search_facilities(
     query: str = "",
@@ -128,26 +377,16 @@ async def search_facilities(
     Returns:
         JSON with matching facilities including name, location, provider, capacity, and coordinates.
     """
-    params = {
-        k: v for k, v in {
-            "query": query, "country": country, "state": state,
-            "city": city, "provider": provider, "limit": min(limit, 100),
-        }.items() if v
-    }
-    _track_mcp_request("search_facilities", params)
-    result = _api_get("/api/v1/facilities", params)
-    return json.dumps(result, indent=2)
+    params = _params(
+        query=query, country=country, state=state,
+        city=city, provider=provider, limit=_clamp(limit, 1, 100),
+    )
+    return await _run_tool("search_facilities", "/api/v1/facilities", params)
 
 
 @mcp.tool(
     name="get_facility",
-    annotations={
-        "title": "Get Facility Details",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
+    annotations={**_READONLY_ANN, "title": "Get Facility Details"},
 )
 async def get_facility(facility_id: str) -> str:
     """Get detailed information about a specific data center facility.
@@ -159,20 +398,15 @@ async def get_facility(facility_id: str) -> str:
         JSON with full facility details: name, address, coordinates, provider,
         power capacity (MW), certifications, connectivity, and nearby infrastructure.
     """
-    _track_mcp_request("get_facility", {"facility_id": facility_id})
-    result = _api_get(f"/api/v1/facilities/{facility_id}")
-    return json.dumps(result, indent=2)
+    return await _run_tool(
+        "get_facility", f"/api/v1/facilities/{facility_id}",
+        track={"facility_id": facility_id},
+    )
 
 
 @mcp.tool(
     name="list_transactions",
-    annotations={
-        "title": "List M&A Transactions",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
+    annotations={**_READONLY_ANN, "title": "List M&A Transactions"},
 )
 async def list_transactions(
     year: int = 0,
@@ -192,27 +426,15 @@ async def list_transactions(
         JSON array of transactions with buyer, seller, deal value,
         MW capacity, market, and announcement date.
     """
-    params = {
-        k: v for k, v in {
-            "year": year if year else None,
-            "buyer": buyer, "seller": seller,
-            "limit": min(limit, 100),
-        }.items() if v
-    }
-    _track_mcp_request("list_transactions", params)
-    result = _api_get("/api/v1/transactions", params)
-    return json.dumps(result, indent=2)
+    params = _params(
+        year=year, buyer=buyer, seller=seller, limit=_clamp(limit, 1, 100),
+    )
+    return await _run_tool("list_transactions", "/api/v1/transactions", params)
 
 
 @mcp.tool(
     name="get_market_intel",
-    annotations={
-        "title": "Get Market Intelligence",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
+    annotations={**_READONLY_ANN, "title": "Get Market Intelligence"},
 )
 async def get_market_intel(
     market: str = "",
@@ -229,25 +451,17 @@ async def get_market_intel(
         JSON with market statistics including total MW, facility count,
         absorption rates, pricing benchmarks, and growth trends.
     """
-    _track_mcp_request("get_market_intel", {"market": market, "metric": metric})
-    if market:
-        # Specific market details (may require auth)
-        result = _api_get(f"/api/v1/markets/{market}")
-    else:
-        # Global overview - free endpoint
-        result = _api_get("/api/v1/markets/list")
-    return json.dumps(result, indent=2)
+    # Specific market details may require auth; the list endpoint is free.
+    path = f"/api/v1/markets/{market}" if market else "/api/v1/markets/list"
+    return await _run_tool(
+        "get_market_intel", path,
+        track={"market": market, "metric": metric},
+    )
 
 
 @mcp.tool(
     name="get_news",
-    annotations={
-        "title": "Get Industry News",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
+    annotations={**_READONLY_ANN, "title": "Get Industry News"},
 )
 async def get_news(
     topic: str = "",
@@ -264,25 +478,13 @@ async def get_news(
     Returns:
         JSON array of news articles with title, source, date, summary, and URL.
     """
-    params = {
-        k: v for k, v in {
-            "topic": topic, "source": source, "limit": min(limit, 50),
-        }.items() if v
-    }
-    _track_mcp_request("get_news", params)
-    result = _api_get("/api/v1/news", params)
-    return json.dumps(result, indent=2)
+    params = _params(topic=topic, source=source, limit=_clamp(limit, 1, 50))
+    return await _run_tool("get_news", "/api/v1/news", params)
 
 
 @mcp.tool(
     name="analyze_site",
-    annotations={
-        "title": "Analyze Site for Data Center",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True,
-    },
+    annotations={**_READONLY_ANN, "title": "Analyze Site for Data Center"},
 )
 async def analyze_site(
     latitude: float = 0.0,
@@ -305,51 +507,105 @@ async def analyze_site(
         JSON with composite site score (0-100), component scores for power,
         connectivity, risk, and workforce, plus nearby facilities and infrastructure.
     """
-    params = {
-        k: v for k, v in {
-            "lat": latitude if latitude else None,
-            "lng": longitude if longitude else None,
-            "address": address,
-            "radius": radius_miles * 1609,  # Convert miles to meters
-        }.items() if v
-    }
-    _track_mcp_request("analyze_site", params)
-    result = _api_get("/api/v1/energy/site-analysis", params)
-    return json.dumps(result, indent=2)
+    # Unbounded radii would push the backend into very expensive spatial scans.
+    radius_miles = _clamp(radius_miles, 1, 200)
+    params = _params(
+        lat=latitude,
+        lng=longitude,
+        address=address,
+        radius=radius_miles * 1609,  # Convert miles to meters
+    )
+    return await _run_tool("analyze_site", "/api/v1/energy/site-analysis", params)
+
+
+@mcp.tool(
+    name="clear_cache",
+    annotations={
+        "title": "Clear Response Cache",
+        "readOnlyHint": False,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": False,
+    },
+)
+async def clear_cache() -> str:
+    """Drop all cached backend responses (admin). Use after backend data changes.
+
+    Returns:
+        JSON confirming the number of entries evicted.
+    """
+    with _cache_lock:
+        evicted = len(_cache)
+        _cache.clear()
+    _track_mcp_request("clear_cache", {})
+    return _encode({"cleared": evicted})
 
 
 # ---------------------------------------------------------------------------
 # ASGI Middleware to capture API key from incoming requests
 # ---------------------------------------------------------------------------
 
+# Matches api_key=... in a raw query string without decoding or splitting it.
+_QS_API_KEY_RE = re.compile(rb"(?:^|&)api_key=([^&]*)")
+
+
+def _extract_api_key(scope) -> str:
+    """Pull the API key from the X-API-Key header or api_key query param."""
+    # Scan the raw header list instead of building a throwaway dict; header
+    # bytes are ASCII-safe so latin-1 decodes without UTF-8 validation.
+    # An empty header value must not shadow the query-param fallback.
+    for k, v in scope.get("headers", ()):
+        if k == b"x-api-key" and v:
+            return v.decode("latin-1")
+    # Fallback: single regex hop over the raw query string bytes — no
+    # decode, no list of all params.
+    m = _QS_API_KEY_RE.search(scope.get("query_string", b""))
+    return m.group(1).decode("latin-1") if m else ""
+
+
 class APIKeyMiddleware:
     """ASGI middleware that captures X-API-Key header and sets context variable."""
-    
+
     def __init__(self, app):
         self.app = app
-    
+
     async def __call__(self, scope, receive, send):
-        if scope["type"] == "http":
-            # Extract X-API-Key from request headers
-            headers = dict(scope.get("headers", []))
-            api_key = headers.get(b"x-api-key", b"").decode("utf-8")
-            
-            # Also check for api_key query param
-            if not api_key:
-                query_string = scope.get("query_string", b"").decode("utf-8")
-                for param in query_string.split("&"):
-                    if param.startswith("api_key="):
-                        api_key = param.split("=", 1)[1]
-                        break
-            
-            # Set the context variable for this request
-            token = _current_api_key.set(api_key)
-            try:
-                await self.app(scope, receive, send)
-            finally:
-                _current_api_key.reset(token)
-        else:
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        api_key = _extract_api_key(scope)
+        if not api_key:
+            # No key to forward — skip the contextvar set/reset entirely.
+            return await self.app(scope, receive, send)
+
+        token = _current_api_key.set(api_key)
+        try:
             await self.app(scope, receive, send)
+        finally:
+            _current_api_key.reset(token)
+
+
+class HTTPClientLifespan:
+    """ASGI wrapper that closes the shared httpx client on lifespan shutdown.
+
+    The client's pooled connections belong to the server's event loop, so
+    they must be closed inside it — closing after uvicorn.run returns would
+    hit an already-dead loop.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "lifespan":
+            return await self.app(scope, receive, send)
+
+        async def send_wrapper(message):
+            if message["type"] == "lifespan.shutdown.complete":
+                await _client.aclose()
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
 
 
 # ---------------------------------------------------------------------------
@@ -359,7 +615,7 @@ class APIKeyMiddleware:
 if __name__ == "__main__":
     import argparse
     import uvicorn
-    
+
     parser = argparse.ArgumentParser()
     parser.add_argument("--port", type=int, default=8888)
     args = parser.parse_args()
@@ -370,7 +626,10 @@ if __name__ == "__main__":
     logger.info(f"  Tools: {len(mcp._tool_manager._tools)} | Resources: 2 | Prompts: 2")
     logger.info(f"  API key forwarding: ENABLED")
     
-    # Get the ASGI app from FastMCP and wrap with API key middleware
+    # Get the ASGI app from FastMCP and wrap with API key middleware plus
+    # the lifespan hook that closes the httpx client on shutdown
     base_app = mcp.streamable_http_app()
-    app = APIKeyMiddleware(base_app)
-    uvicorn.run(app, host="0.0.0.0", port=args.port)
+    app = HTTPClientLifespan(APIKeyMiddleware(base_app))
+    # libuv event loop + C HTTP parser: measurably higher throughput
+    # than the pure-Python defaults under bursty concurrent tool calls.
+    uvicorn.run(app, host="0.0.0.0", port=args.port, loop="uvloop", http="httptools")